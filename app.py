@@ -1,18 +1,27 @@
 from openai import OpenAI
 import streamlit as st
 import os
-from datetime import datetime
+import time
 from dotenv import load_dotenv
 from utils import (
-    InterviewMemory, 
-    is_negative_response, 
-    evaluate_response, 
+    InterviewMemory,
+    evaluate_turn,
     FIELD_REQUIREMENTS,
+    NEXT_FIELD,
+    HISTORY_FILE,
     load_chat_history,
-    save_chat_history
+    append_event,
+    append_turn,
+    fresh_interview_form,
+    save_form_state
 )
 load_dotenv()
 
+@st.cache_resource
+def get_openai_client():
+    """Shared OpenAI client so the HTTP connection pool survives reruns"""
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
 def initialize_session_state():
     # Try to load existing chat history
     if "messages" not in st.session_state or "interview_form" not in st.session_state or "memory" not in st.session_state:
@@ -23,84 +32,88 @@ def initialize_session_state():
             st.session_state.interview_form = interview_form
             st.session_state.memory = memory
         else:  # Initialize new session
-            st.session_state.messages = [{
+            greeting = {
                 "role": "assistant",
                 "content": "Could you please tell me your full name?"
-            }]
-            st.session_state.interview_form = {
-                field: {"value": "", "responses": [], "satisfaction": 0}
-                for field in FIELD_REQUIREMENTS.keys()
             }
+            st.session_state.messages = [greeting]
+            st.session_state.interview_form = fresh_interview_form()
             st.session_state.memory = InterviewMemory()
+            # Log the greeting too, so it survives a reload
+            append_event(HISTORY_FILE, greeting)
 
     if "current_field" not in st.session_state:
         st.session_state.current_field = "name"
     if "show_summary" not in st.session_state:
         st.session_state.show_summary = True
+    if "last_save" not in st.session_state:
+        st.session_state.last_save = 0.0
+
+@st.cache_data
+def render_field_block(value: str, responses: tuple) -> str:
+    """Build the markdown body for one field's expander
+
+    Cached on its arguments, so unchanged fields cost a lookup instead
+    of a rebuild on every rerun.
+    """
+    if not value:
+        return "*No response provided*"
+    if responses:
+        return "**Responses:**\n" + "\n".join(f"- {response}" for response in responses)
+    return value
 
 def display_interview_summary():
-    with st.sidebar:
-        st.markdown("## 📋 Interview Summary")
-        
-        # Overall progress
-        total_fields = len(st.session_state.interview_form)
-        completed_fields = sum(1 for field in st.session_state.interview_form.values() 
-                             if field["satisfaction"] >= 7)
-        st.progress(completed_fields / total_fields)
-        st.markdown(f"**Progress:** {completed_fields}/{total_fields} topics completed")
-        
-        # Detailed summary for each field
-        st.markdown("### Detailed Responses")
-        for field, data in st.session_state.interview_form.items():
-            satisfaction = data["satisfaction"]
-            
-            # Determine status emoji
-            if satisfaction >= 7:
-                status = "✅"
-            elif satisfaction > 0:
-                status = "⚠️"
-            else:
-                status = "❌"
-            
-            # Create expandable section for each field
-            with st.expander(f"{status} {field.replace('_', ' ').title()} ({satisfaction}/10)"):
-                if data["value"]:
-                    st.markdown("**Responses:**")
-                    if isinstance(data["responses"], list):
-                        for i, response in enumerate(data["responses"], 1):
-                            st.markdown(f"- {response}")
-                    else:
-                        st.markdown(data["value"])
-                else:
-                    st.markdown("*No response provided*")
+    st.markdown("## 📋 Interview Summary")
+
+    # Overall progress
+    total_fields = len(st.session_state.interview_form)
+    completed_fields = sum(1 for field in st.session_state.interview_form.values()
+                         if field["satisfaction"] >= 7)
+    st.progress(completed_fields / total_fields)
+    st.markdown(f"**Progress:** {completed_fields}/{total_fields} topics completed")
+
+    # Detailed summary for each field
+    st.markdown("### Detailed Responses")
+    for field, data in st.session_state.interview_form.items():
+        satisfaction = data["satisfaction"]
+
+        # Determine status emoji
+        if satisfaction >= 7:
+            status = "✅"
+        elif satisfaction > 0:
+            status = "⚠️"
+        else:
+            status = "❌"
+
+        # Create expandable section for each field
+        responses = data["responses"] if isinstance(data["responses"], list) else []
+        with st.expander(f"{status} {field.replace('_', ' ').title()} ({satisfaction}/10)"):
+            st.markdown(render_field_block(data["value"], tuple(responses)))
 
 def get_next_field(client, prompt):
-    # check for negative response
-    if is_negative_response(client, prompt):
-        fields = list(st.session_state.interview_form.keys())
-        current_index = fields.index(st.session_state.current_field)
-        next_field = fields[current_index + 1] if current_index + 1 < len(fields) else None
-        
-        if next_field:
-            st.session_state.current_field = next_field
-            next_question = FIELD_REQUIREMENTS[next_field]["follow_up_questions"][0]
-            response = f"I understand. Let's move on to your {next_field.replace('_', ' ')}. {next_question}"
-            st.session_state.messages.append({"role": "assistant", "content": response})
-        else:
-            response = "Thank you for your time. We've completed all topics!"
-            st.session_state.messages.append({"role": "assistant", "content": response})
-        
-        return next_field, response
-
-    # evaluate response
-    try: 
-        evaluation = evaluate_response(
-            client, 
-            prompt, 
-            st.session_state.current_field, 
+    # classify and evaluate the turn with a single LLM call
+    try:
+        evaluation = evaluate_turn(
+            client,
+            prompt,
+            st.session_state.current_field,
             st.session_state.memory
         )
 
+        if evaluation["intent"] == "negative":
+            next_field = NEXT_FIELD[st.session_state.current_field]
+
+            if next_field:
+                st.session_state.current_field = next_field
+                next_question = FIELD_REQUIREMENTS[next_field]["follow_up_questions"][0]
+                response = f"I understand. Let's move on to your {next_field.replace('_', ' ')}. {next_question}"
+                st.session_state.messages.append({"role": "assistant", "content": response})
+            else:
+                response = "Thank you for your time. We've completed all topics!"
+                st.session_state.messages.append({"role": "assistant", "content": response})
+
+            return next_field, response
+
         # Update form with complete history
         st.session_state.interview_form[st.session_state.current_field].update({
             "value": st.session_state.memory.get_field_history(st.session_state.current_field),
@@ -109,9 +122,7 @@ def get_next_field(client, prompt):
         })         
 
         if evaluation["satisfaction_score"] >= 7:
-            fields = list(st.session_state.interview_form.keys())
-            current_index = fields.index(st.session_state.current_field)
-            next_field = fields[current_index + 1] if current_index + 1 < len(fields) else None
+            next_field = NEXT_FIELD[st.session_state.current_field]
             
             if next_field:
                 response = f"Great! Let's move on to your {next_field.replace('_', ' ')}. {FIELD_REQUIREMENTS[next_field]['follow_up_questions'][0]}"
@@ -128,14 +139,15 @@ def get_next_field(client, prompt):
     
     except Exception as e:
         st.error(f"Error processing response: {str(e)}")
-        return None, str(e)
+        return None, None
 
 def main():
     initialize_session_state()
 
     # Show summary if enabled
     if st.session_state.show_summary:
-        display_interview_summary()
+        with st.sidebar:
+            display_interview_summary()
 
     # Main chat area
     st.title("AI Interviewer")
@@ -154,24 +166,36 @@ def main():
             st.markdown(prompt)
 
         # process the response
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
+        client = get_openai_client()
+
+        field_before = st.session_state.current_field
         next_field, response = get_next_field(client, prompt)
-        
+
+        if response is None:
+            # Evaluation failed: st.error is already on screen, and the
+            # failure must not be rendered or logged as an assistant turn
+            return
+
         with st.chat_message("assistant"):
             st.markdown(response)
 
         if next_field:
             st.session_state.current_field = next_field
 
-        # Save chat history after each interaction
-        save_chat_history(
-            st.session_state.messages,
-            st.session_state.interview_form,
-            st.session_state.memory
-        )
+        # Append only the new exchange to the transcript log
+        append_turn(prompt, response)
+
+        # Snapshot the form when its state changes or after a quiet period
+        field_changed = next_field != field_before
+        if field_changed or time.monotonic() - st.session_state.last_save > 2.0:
+            save_form_state(
+                st.session_state.interview_form,
+                st.session_state.memory
+            )
+            st.session_state.last_save = time.monotonic()
 
-        # Force a rerun to update the display
+        # Rerun so the sidebar summary reflects this turn (it renders
+        # before the prompt is processed)
         st.rerun()
 
 if __name__ == "__main__":
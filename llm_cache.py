@@ -0,0 +1,113 @@
+from typing import Dict, List, Optional, Protocol, Tuple
+import hashlib
+import os
+import re
+import shelve
+import time
+
+import orjson
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[dict]:
+        ...
+
+    def set(self, key: str, value: dict):
+        ...
+
+class ShelveBackend:
+    """Simple on-disk backend built on stdlib shelve"""
+    def __init__(self, path: str = "chat_history/llm_cache"):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+
+    def get(self, key: str) -> Optional[dict]:
+        with shelve.open(self.path) as db:
+            return db.get(key)
+
+    def set(self, key: str, value: dict):
+        with shelve.open(self.path) as db:
+            db[key] = value
+
+class LLMCache:
+    """In-memory + on-disk cache for deterministic LLM calls.
+
+    Entries are stored as {"value": ..., "stored_at": ...} so stale
+    entries can be expired with a TTL.
+    """
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = None):
+        self.backend = backend or ShelveBackend()
+        self.ttl = ttl
+        self.memory: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, payload: dict) -> str:
+        """Deterministic key from the request payload"""
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(raw).hexdigest()
+
+    def _expired(self, entry: dict) -> bool:
+        return self.ttl is not None and time.time() - entry["stored_at"] > self.ttl
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self.memory.get(key)
+        if entry is None:
+            entry = self.backend.get(key)
+            if entry is not None:
+                self.memory[key] = entry
+        if entry is None or self._expired(entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["value"]
+
+    def set(self, key: str, value: dict):
+        entry = {"value": value, "stored_at": time.time()}
+        self.memory[key] = entry
+        self.backend.set(key, entry)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.memory)}
+
+_TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+class SemanticLLMCache(LLMCache):
+    """LLMCache with a near-duplicate lookup on exact-key misses.
+
+    Similarity is token-set Jaccard over a per-namespace in-memory
+    index, so lightly reworded repeats of an earlier response still hit
+    without pulling in an embedding model.
+    """
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = None,
+                 similarity_threshold: float = 0.9):
+        super().__init__(backend, ttl)
+        self.similarity_threshold = similarity_threshold
+        self._index: Dict[str, List[Tuple[frozenset, str]]] = {}
+
+    @staticmethod
+    def _tokens(text: str) -> frozenset:
+        return frozenset(_TOKEN_RE.findall(text.lower()))
+
+    def get_similar(self, namespace: str, text: str) -> Optional[dict]:
+        """Return the cached value of the closest indexed text, if any"""
+        probe = self._tokens(text)
+        if not probe:
+            return None
+
+        best_key = None
+        best_score = self.similarity_threshold
+        for tokens, key in self._index.get(namespace, []):
+            score = len(probe & tokens) / len(probe | tokens)
+            if score >= best_score:
+                best_score = score
+                best_key = key
+
+        if best_key is None:
+            return None
+        return self.get(best_key)
+
+    def remember(self, namespace: str, text: str, key: str):
+        """Index a text so future near-duplicates can find its entry"""
+        tokens = self._tokens(text)
+        if tokens:
+            self._index.setdefault(namespace, []).append((tokens, key))
@@ -1,29 +1,142 @@
 from typing import Dict
 from collections import defaultdict
-import json
+import asyncio
+import logging
 import os
+import re
+import time
+
+import orjson
+
+from llm_cache import SemanticLLMCache
+
+logger = logging.getLogger(__name__)
+
+evaluation_cache = SemanticLLMCache()
+
+# Scoring a response and writing a follow-up question does not need the
+# strongest model tier; keep it overridable for experiments
+EVAL_MODEL = os.getenv("EVAL_MODEL", "gpt-4o-mini")
+
+# Above this many stored responses, older ones are folded into a
+# rolling summary so prompt size stays bounded
+MAX_FIELD_RESPONSES = 3
 
 class InterviewMemory:
     def __init__(self):
         self.field_memory = defaultdict(list)
-        self.current_responses = defaultdict(str)
-    
+        self.summaries = {}
+        self._joined_cache = {}
+
     def add_response(self, field: str, response: str):
         """Add a new response to the field's history"""
         self.field_memory[field].append(response)
-        self.current_responses[field] = " ".join(self.field_memory[field])
-    
+        self._joined_cache.pop(field, None)  # invalidate
+
+    def _pending_compaction(self, field: str):
+        """Responses due for summarization, or None while under limit"""
+        responses = self.field_memory[field]
+        if len(responses) <= MAX_FIELD_RESPONSES:
+            return None
+
+        older = responses[:-2]
+        if field in self.summaries:
+            older = [self.summaries[field]] + older
+        return older
+
+    @staticmethod
+    def _summary_request(older: list) -> dict:
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": "You summarize interview answers. Respond with a short factual summary only."},
+                {"role": "user", "content": "Summarize these interview answers in 2-3 sentences:\n" + "\n".join(older)}
+            ],
+            "temperature": 0
+        }
+
+    def apply_summary(self, field: str, summary: str):
+        """Adopt a rolling summary, keeping the last two responses
+
+        The evaluation call already reads the whole history, so its
+        summary replaces everything but the two most recent responses
+        without a separate summarization round-trip.
+        """
+        self.summaries[field] = summary
+        if len(self.field_memory[field]) > 2:
+            self.field_memory[field] = self.field_memory[field][-2:]
+        self._joined_cache.pop(field, None)
+
+    def compact(self, client, field: str):
+        """Fold older responses into a rolling summary
+
+        Keeps the two most recent responses verbatim and summarizes the
+        rest with a cheap model, so the history sent to the evaluator
+        stays bounded instead of growing with every turn.
+        """
+        older = self._pending_compaction(field)
+        if older is None:
+            return
+
+        try:
+            completion = client.chat.completions.create(**self._summary_request(older))
+            self.apply_summary(field, completion.choices[0].message.content.strip())
+        except Exception as e:
+            logger.error("Error compacting memory: %s", e)
+
+    async def compact_async(self, client, field: str):
+        """Async variant of compact for use with AsyncOpenAI"""
+        older = self._pending_compaction(field)
+        if older is None:
+            return
+
+        try:
+            completion = await client.chat.completions.create(**self._summary_request(older))
+            self.apply_summary(field, completion.choices[0].message.content.strip())
+        except Exception as e:
+            logger.error("Error compacting memory: %s", e)
+
     def get_field_history(self, field: str) -> str:
         """Get the combined history of all responses for a field"""
-        return self.current_responses[field]
+        joined = self._joined_cache.get(field)
+        if joined is None:
+            parts = self.field_memory[field]
+            if field in self.summaries:
+                parts = [self.summaries[field]] + parts
+            joined = " ".join(parts)
+            self._joined_cache[field] = joined
+        return joined
     
+    def get_prior_history(self, field: str) -> str:
+        """Combined history excluding the most recent response"""
+        parts = self.field_memory[field][:-1]
+        if field in self.summaries:
+            parts = [self.summaries[field]] + parts
+        return " ".join(parts)
+
     def get_latest_response(self, field: str) -> str:
         """Get only the most recent response"""
         return self.field_memory[field][-1] if self.field_memory[field] else ""
     
     def get_all_responses(self, field: str) -> list:
         """Get list of all responses for a field"""
-        return self.field_memory[field]
+        return list(self.field_memory[field])
+
+    def to_dict(self) -> dict:
+        """Serialize to a plain dict (current_responses is derivable)"""
+        return {
+            "field_memory": dict(self.field_memory),
+            "summaries": self.summaries
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "InterviewMemory":
+        """Rebuild memory from a dict produced by to_dict"""
+        memory = cls()
+        for field, responses in data.get("field_memory", {}).items():
+            memory.field_memory[field] = list(responses)
+        memory.summaries = dict(data.get("summaries", {}))
+        return memory
 
 FIELD_REQUIREMENTS = {
     "name": {
@@ -90,6 +203,48 @@ FIELD_REQUIREMENTS = {
     }
 }
 
+# O(1) successor lookup for walking the interview fields in order;
+# the last field maps to None
+_FIELDS = list(FIELD_REQUIREMENTS)
+NEXT_FIELD = {_FIELDS[i]: _FIELDS[i + 1] for i in range(len(_FIELDS) - 1)}
+NEXT_FIELD[_FIELDS[-1]] = None
+
+# Frozen response_format objects, one per field, built once at import
+# and passed by reference on every evaluation call. Baking the field's
+# expected information into the schema description specializes the
+# structured output per field.
+FIELD_RESPONSE_FORMATS = {
+    field: {
+        "type": "json_schema",
+        "json_schema": {
+            "name": f"eval_{field}",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    # Decision-gating keys first so streaming consumers
+                    # can act before the longer prose keys finish
+                    "intent": {"type": "string", "enum": ["negative", "answer"]},
+                    "satisfaction_score": {"type": "integer", "minimum": 1, "maximum": 10},
+                    "follow_up_question": {"type": "string"},
+                    "analysis": {"type": "string"},
+                    "missing_info": {
+                        "type": "string",
+                        "description": f"Information still missing from: {requirements['expected']}"
+                    },
+                    "summary": {
+                        "type": "string",
+                        "description": "Updated 1-2 sentence summary of everything the candidate has said for this field"
+                    }
+                },
+                "required": ["intent", "satisfaction_score", "analysis",
+                             "missing_info", "follow_up_question", "summary"],
+                "additionalProperties": False
+            }
+        }
+    }
+    for field, requirements in FIELD_REQUIREMENTS.items()
+}
+
 interview_form = {
     "name": {"value": "", "satisfaction": 0},
     "current_role": {"value": "", "satisfaction": 0},
@@ -100,135 +255,533 @@ interview_form = {
     "preferred_work_environment": {"value": "", "satisfaction": 0},
 }
 
-def evaluate_response(client, response: str, field: str, memory: InterviewMemory) -> Dict:
+# Fields whose satisfaction is decidable with plain Python, so no LLM
+# call is needed for them. An evaluator may return None to hand the
+# turn to the LLM instead of guessing.
+# Two or more alphabetic tokens in any case or script count as a name;
+# [^\W\d_] is "letter" without needing the unicodedata module
+_NAME_RE = re.compile(r"[^\W\d_]+(?:[ '’-]+[^\W\d_]+)+")
+_YEARS_RE = re.compile(r"\d+\s*(years?|yrs?)", re.I)
+
+def _evaluate_name(response: str):
+    if _NAME_RE.fullmatch(response.strip()):
+        return {
+            "intent": "answer",
+            "satisfaction_score": 9,
+            "analysis": "Full name provided",
+            "missing_info": "none",
+            "follow_up_question": ""
+        }
+    # Not obviously a name ("it's jane, but everyone calls me JD"):
+    # let the LLM evaluator decide rather than scoring a canned 4
+    return None
+
+def _evaluate_years(response: str) -> Dict:
+    if _YEARS_RE.search(response):
+        return {
+            "intent": "answer",
+            "satisfaction_score": 8,
+            "analysis": "Years of experience stated",
+            "missing_info": "none",
+            "follow_up_question": ""
+        }
+    return {
+        "intent": "answer",
+        "satisfaction_score": 4,
+        "analysis": "No explicit number of years found",
+        "missing_info": "Number of years of experience",
+        "follow_up_question": FIELD_REQUIREMENTS["years_of_experience"]["follow_up_questions"][0]
+    }
+
+DETERMINISTIC_EVALUATORS = {
+    "name": _evaluate_name,
+    "years_of_experience": _evaluate_years
+}
+
+def _local_evaluation(response: str, field: str) -> Dict:
+    """Resolve the turn without the LLM where possible, else None"""
+    # Clear negatives are decided locally without any LLM call
+    if is_negative_response(response):
+        return {
+            "intent": "negative",
+            "satisfaction_score": 0,
+            "analysis": "Candidate declined the topic",
+            "missing_info": "none",
+            "follow_up_question": ""
+        }
+
+    # Deterministic fields skip the LLM when they can decide
+    if field in DETERMINISTIC_EVALUATORS:
+        return DETERMINISTIC_EVALUATORS[field](response)
+
+    return None
+
+def _evaluation_cache_key(field: str, complete_response: str, response: str) -> str:
+    return evaluation_cache.cache_key({
+        "model": EVAL_MODEL,
+        "fused": True,
+        "field": field,
+        "expected": FIELD_REQUIREMENTS[field]["expected"],
+        "history": complete_response,
+        "latest": response
+    })
+
+# Static instruction block sent as the system message on every
+# evaluation call. It is byte-identical across calls (rubric plus all
+# field requirements up front, dynamic content only in the user
+# message), so provider-side prompt caching can reuse the prefix.
+_STATIC_PREAMBLE = (
+    "You are an expert interviewer evaluating responses.\n"
+    "First decide whether the latest response is a clear refusal or\n"
+    "negative (e.g. \"no\", \"none\", \"I don't have any experience\").\n"
+    "Then evaluate the complete response history and provide:\n"
+    "1. A satisfaction score (1-10)\n"
+    "2. A brief analysis\n"
+    "3. Any missing information\n"
+    "4. A follow-up question if needed\n"
+    "Respond as JSON with keys: intent ('negative' or 'answer'),\n"
+    "satisfaction_score, follow_up_question, analysis, missing_info,\n"
+    "summary (an updated 1-2 sentence summary of all responses for the\n"
+    "field). Emit intent and satisfaction_score first, then\n"
+    "follow_up_question, then the prose keys last.\n"
+    "\n"
+    "Field requirements:\n"
+    + "\n".join(
+        f"- {field}: {requirements['expected']}"
+        for field, requirements in FIELD_REQUIREMENTS.items()
+    )
+)
+
+# Per-field user-message prefixes, interpolated once at import so each
+# call only concatenates the dynamic history and response
+_PROMPT_TEMPLATES = {
+    field: f"Field being evaluated: {field}\nComplete response history: "
+    for field in FIELD_REQUIREMENTS
+}
+
+def _evaluation_prompt(field: str, complete_response: str, response: str) -> str:
+    return (
+        _PROMPT_TEMPLATES[field]
+        + complete_response
+        + "\nLatest response: "
+        + response
+    )
+
+def _completion_kwargs(field: str, complete_response: str, response: str) -> dict:
+    return {
+        "model": EVAL_MODEL,
+        "messages": [
+            {"role": "system", "content": _STATIC_PREAMBLE},
+            {"role": "user", "content": _evaluation_prompt(field, complete_response, response)}
+        ],
+        "temperature": 0,  # Deterministic so results are cacheable
+        "stream": True,
+        "response_format": FIELD_RESPONSE_FORMATS[field]
+    }
+
+# Incremental extraction of the decision-gating keys from a partially
+# streamed JSON object; prose keys are emitted last by construction
+_INTENT_PART_RE = re.compile(r'"intent"\s*:\s*"(negative|answer)"')
+_SCORE_PART_RE = re.compile(r'"satisfaction_score"\s*:\s*(\d+)')
+_FOLLOWUP_PART_RE = re.compile(r'"follow_up_question"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+def _early_evaluation(partial: str):
+    """Build an evaluation from a partial stream once the gating keys
+    have fully arrived, else None"""
+    intent = _INTENT_PART_RE.search(partial)
+    score = _SCORE_PART_RE.search(partial)
+    follow_up = _FOLLOWUP_PART_RE.search(partial)
+    if not (intent and score and follow_up):
+        return None
+
+    return {
+        "intent": intent.group(1),
+        "satisfaction_score": int(score.group(1)),
+        "follow_up_question": orjson.loads(f'"{follow_up.group(1)}"'),
+        "analysis": "Analysis not provided",
+        "missing_info": "None",
+        "summary": ""
+    }
+
+def _parse_evaluation(content: str, field: str, cache_key: str) -> Dict:
+    evaluation = orjson.loads(content)
+
+    # Add default values if any key is missing
+    evaluation.setdefault("intent", "answer")
+    evaluation.setdefault("satisfaction_score", 5)
+    evaluation.setdefault("analysis", "Analysis not provided")
+    evaluation.setdefault("missing_info", "None")
+    evaluation.setdefault("follow_up_question", FIELD_REQUIREMENTS[field]['follow_up_questions'][0])
+    evaluation.setdefault("summary", "")
+
+    evaluation_cache.set(cache_key, evaluation)
+
+    return evaluation
+
+def _error_evaluation(field: str) -> Dict:
+    return {
+        "intent": "answer",
+        "satisfaction_score": 5,
+        "analysis": "Error occurred during analysis",
+        "missing_info": "Error in evaluation",
+        "follow_up_question": FIELD_REQUIREMENTS[field]['follow_up_questions'][0] if field in FIELD_REQUIREMENTS else "Could you please provide more details?",
+        "skip_topic": False
+    }
+
+def _probe_cache(field: str, complete_response: str, response: str,
+                 memory: InterviewMemory):
+    """Look up an evaluation by exact key, then by near-duplicate
+
+    The similarity namespace is scoped to (field, history *before* the
+    latest response) and only the latest response is compared. The full
+    history would be useless as a namespace — it already contains the
+    latest response, so any rewording changes it too — while the prior
+    history is shared by all rewordings of the same turn and differs
+    between turns, so elaborations can never match the previous turn's
+    evaluation. Returns (cache_key, namespace, cached-or-None); shared
+    by the sync and async paths so caching cannot drift.
+    """
+    cache_key = _evaluation_cache_key(field, complete_response, response)
+    namespace = evaluation_cache.cache_key({
+        "field": field,
+        "history": memory.get_prior_history(field)
+    })
+    cached = evaluation_cache.get(cache_key)
+    if cached is None:
+        cached = evaluation_cache.get_similar(namespace, response)
+    return cache_key, namespace, cached
+
+def _finish_turn(evaluation: Dict, field: str, memory: InterviewMemory,
+                 namespace: str, response: str, cache_key: str) -> Dict:
+    """Shared post-processing for a freshly generated evaluation"""
+    evaluation_cache.remember(namespace, response, cache_key)
+
+    # The evaluator's own summary becomes the compressed history,
+    # so future prompts send summary + latest instead of everything
+    if evaluation.get("summary"):
+        memory.apply_summary(field, evaluation["summary"])
+
+    return evaluation
+
+def evaluate_turn(client, response: str, field: str, memory: InterviewMemory) -> Dict:
+    """Classify and evaluate a user turn with a single LLM call
+
+    Folds the negative-response check into the evaluation prompt, so
+    each turn costs at most one round-trip instead of two.
+    """
+    local = _local_evaluation(response, field)
+    if local is not None:
+        return local
+
     try:
-        # Get complete history for this field
+        # Keep the history sent to the evaluator bounded
+        memory.compact(client, field)
         complete_response = memory.get_field_history(field)
-        
-        # Create the evaluation prompt
-        evaluation_prompt = f"""
-        You are evaluating a response for the field: {field}
-        Expected information: {FIELD_REQUIREMENTS[field]['expected']}
-        Complete response history: {complete_response}
-        Latest response: {response}
-
-        Please evaluate the complete response history and provide:
-        1. A satisfaction score (1-10)
-        2. A brief analysis
-        3. Any missing information
-        4. A follow-up question if needed
-
-        Format your response as JSON:
-        {{
-            "satisfaction_score": <score>,
-            "analysis": "<brief analysis>",
-            "missing_info": "<list missing info or 'none'>",
-            "follow_up_question": "<question to get missing info>"
-        }}
-        """
 
-        # Get completion from OpenAI
-        completion = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are an expert interviewer evaluating responses."},
-                {"role": "user", "content": evaluation_prompt}
-            ],
-            temperature=0.7
+        cache_key, namespace, cached = _probe_cache(field, complete_response, response, memory)
+        if cached is not None:
+            return cached
+
+        # Once the history is long enough to need compacting, drain the
+        # whole stream so the evaluator's summary key arrives; otherwise
+        # compact() would have to make a separate call next turn
+        need_summary = len(memory.field_memory[field]) >= MAX_FIELD_RESPONSES
+
+        # Stream the completion so tokens are consumed as they arrive,
+        # with JSON mode guaranteeing parseable output
+        stream = client.chat.completions.create(
+            **_completion_kwargs(field, complete_response, response)
         )
 
-        # Extract the response
-        evaluation = json.loads(completion.choices[0].message.content)
-        
-        # Add default values if any key is missing
-        evaluation.setdefault("satisfaction_score", 5)
-        evaluation.setdefault("analysis", "Analysis not provided")
-        evaluation.setdefault("missing_info", "None")
-        evaluation.setdefault("follow_up_question", FIELD_REQUIREMENTS[field]['follow_up_questions'][0])
-        
-        return evaluation
+        buffer = []
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                buffer.append(delta)
+                # The gating keys stream first; stop as soon as the
+                # next question is decidable
+                if not need_summary and '"' in delta:
+                    evaluation = _early_evaluation("".join(buffer))
+                    if evaluation is not None:
+                        stream.close()
+                        # Served but never cached or indexed: the prose
+                        # keys are placeholders, not the model's answer
+                        return evaluation
+
+        evaluation = _parse_evaluation("".join(buffer), field, cache_key)
+        return _finish_turn(evaluation, field, memory, namespace, response, cache_key)
 
     except Exception as e:
-        print(f"Error in evaluation: {str(e)}")
-        return {
-            "satisfaction_score": 5,
-            "analysis": "Error occurred during analysis",
-            "missing_info": "Error in evaluation",
-            "follow_up_question": FIELD_REQUIREMENTS[field]['follow_up_questions'][0] if field in FIELD_REQUIREMENTS else "Could you please provide more details?",
-            "skip_topic": False
-        }
+        logger.error("Error in evaluation: %s", e)
+        return _error_evaluation(field)
 
-def is_negative_response(client, response: str) -> bool:
-    """
-    Use LLM to determine if the response is negative
+async def evaluate_turn_async(client, response: str, field: str, memory: InterviewMemory) -> Dict:
+    """Async variant of evaluate_turn for use with AsyncOpenAI
+
+    Lets independent evaluations run concurrently via asyncio.gather
+    instead of paying their network latencies back to back.
     """
+    local = _local_evaluation(response, field)
+    if local is not None:
+        return local
+
     try:
-        prompt = f"""
-        Analyze if this response indicates a clear negative
-        Response: "{response}"
-        
-        Consider responses like:
-        - "no"
-        - "none"
-        - "I don't have any experience"
-        - "I haven't done that"
-        - "nothing comes to mind"
-        
-        Return only "true" if it's clearly negative, or "false" otherwise.
-        """
+        # Keep the history sent to the evaluator bounded
+        await memory.compact_async(client, field)
+        complete_response = memory.get_field_history(field)
+
+        cache_key, namespace, cached = _probe_cache(field, complete_response, response, memory)
+        if cached is not None:
+            return cached
+
+        # Drain the whole stream when compaction is due, so the
+        # evaluator's summary key arrives (see evaluate_turn)
+        need_summary = len(memory.field_memory[field]) >= MAX_FIELD_RESPONSES
 
-        completion = client.chat.completions.create(
-            model="gpt-4",
+        stream = await client.chat.completions.create(
+            **_completion_kwargs(field, complete_response, response)
+        )
+
+        buffer = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                buffer.append(delta)
+                if not need_summary and '"' in delta:
+                    evaluation = _early_evaluation("".join(buffer))
+                    if evaluation is not None:
+                        await stream.close()
+                        # Served but never cached or indexed: the prose
+                        # keys are placeholders, not the model's answer
+                        return evaluation
+
+        evaluation = _parse_evaluation("".join(buffer), field, cache_key)
+        return _finish_turn(evaluation, field, memory, namespace, response, cache_key)
+
+    except Exception as e:
+        logger.error("Error in evaluation: %s", e)
+        return _error_evaluation(field)
+
+async def evaluate_responses_batch(client, fields: list, memory: InterviewMemory) -> Dict:
+    """Evaluate several fields' histories with a single LLM call
+
+    Marshals all requested fields into one prompt and expects a JSON
+    array back, so re-scoring N fields (e.g. when resuming a saved
+    interview) costs one round-trip instead of N and stays clear of
+    per-request rate limits.
+    """
+    sections = []
+    for i, field in enumerate(fields, 1):
+        sections.append(
+            f"{i}. Field: {field}\n"
+            f"   Expected information: {FIELD_REQUIREMENTS[field]['expected']}\n"
+            f"   Response history: {memory.get_field_history(field)}"
+        )
+
+    batch_prompt = f"""
+    Evaluate the following {len(fields)} interview responses.
+    For each one provide a satisfaction score (1-10), a brief analysis,
+    any missing information, and a follow-up question if needed.
+
+    {chr(10).join(sections)}
+
+    Format your response as JSON:
+    {{
+        "evaluations": [
+            {{
+                "satisfaction_score": <score>,
+                "analysis": "<brief analysis>",
+                "missing_info": "<list missing info or 'none'>",
+                "follow_up_question": "<question to get missing info>"
+            }}
+        ]
+    }}
+    The array must contain exactly {len(fields)} objects, in order.
+    """
+
+    try:
+        completion = await client.chat.completions.create(
+            model=EVAL_MODEL,
             messages=[
-                {"role": "system", "content": "You are analyzing interview responses. Respond only with 'true' or 'false'."},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": "You are an expert interviewer evaluating responses."},
+                {"role": "user", "content": batch_prompt}
             ],
-            temperature=0.1  # Low temperature for more consistent responses
+            temperature=0,
+            response_format={"type": "json_object"}
         )
 
-        result = completion.choices[0].message.content.strip().lower()
-        return result == "true"
+        evaluations = orjson.loads(completion.choices[0].message.content)["evaluations"]
+        results = {}
+        for field, evaluation in zip(fields, evaluations):
+            evaluation.setdefault("intent", "answer")
+            evaluation.setdefault("satisfaction_score", 5)
+            evaluation.setdefault("analysis", "Analysis not provided")
+            evaluation.setdefault("missing_info", "None")
+            evaluation.setdefault("follow_up_question", FIELD_REQUIREMENTS[field]['follow_up_questions'][0])
+            results[field] = evaluation
+        return results
 
     except Exception as e:
-        print(f"Error in negative response detection: {str(e)}")
-        # Fall back to simple keyword matching if LLM fails
-        negative_indicators = [
-            "no", "none", "nothing", "don't have", "do not have",
-            "nothing comes to mind", "haven't done any", "i don't",
-            "no experience", "no projects"
-        ]
-        response_lower = response.lower().strip()
-        return any(indicator in response_lower for indicator in negative_indicators)
-    
-def save_chat_history(messages: list, interview_form: dict, memory: InterviewMemory):
-    """Save chat history and form data to a JSON file"""
+        logger.error("Error in batch evaluation: %s", e)
+        return {field: _error_evaluation(field) for field in fields}
+
+async def rescore_all(client, interview_form: dict, memory: InterviewMemory,
+                      max_concurrency: int = 5) -> Dict:
+    """Re-evaluate every answered field concurrently
+
+    Fans out one evaluation per field with asyncio.gather, bounded by a
+    semaphore to stay under the API rate limit, so resuming a saved
+    interview costs one round-trip of wall time instead of one per
+    field. Returns {field: evaluation} for fields that have responses.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def rescore_one(field):
+        async with semaphore:
+            latest = memory.get_latest_response(field)
+            return field, await evaluate_turn_async(client, latest, field, memory)
+
+    fields = [field for field in interview_form if memory.get_all_responses(field)]
+    results = await asyncio.gather(*(rescore_one(field) for field in fields))
+    return dict(results)
+
+async def evaluate_fields_concurrently(client, items: list, memory: InterviewMemory) -> list:
+    """Evaluate several (field, response) pairs in parallel
+
+    Wall time becomes the max of the individual calls instead of their
+    sum; items resolved locally or from cache return immediately.
+    """
+    tasks = [evaluate_turn_async(client, response, field, memory)
+             for field, response in items]
+    return await asyncio.gather(*tasks)
+
+# Keyword fast-path for clearly negative answers, so the LLM is only
+# consulted for ambiguous short inputs. Compiled once into a single
+# whole-word alternation: one linear scan instead of K substring scans,
+# and no false match on e.g. "no" inside "notable".
+_NEGATIVE_INDICATORS = (
+    "no", "none", "nothing", "don't have", "dont have", "do not have",
+    "nothing comes to mind", "haven't", "havent", "i don't",
+    "no experience", "no projects"
+)
+NEG_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _NEGATIVE_INDICATORS)) + r")\b", re.I
+)
+
+# Exact forms of unambiguous refusals, checked before the regexes:
+# set membership is a single C-level call
+NEGATIVE_EXACT = frozenset({"no", "none", "nothing"})
+
+# Openers of unambiguous refusals, anchored and boundary-safe so
+# "Nonetheless ..." does not match "none"
+_NEGATIVE_OPENERS = (
+    "no", "none", "nothing", "don't have", "dont have", "do not have",
+    "haven't", "havent", "i don't have"
+)
+NEG_PREFIX_RE = re.compile(
+    r"(?:" + "|".join(map(re.escape, _NEGATIVE_OPENERS)) + r")\b"
+)
+
+def is_negative_response(response: str) -> bool:
+    """
+    Keyword-only check for clearly negative responses
+
+    Only short inputs can be decided here: a long answer that merely
+    opens with a negative word ("No doubt I am experienced") is left to
+    the fused evaluation call, which emits an intent field, so no
+    separate LLM round-trip is needed either way.
+    """
+    normalized = response.lower().strip()
+    if normalized in NEGATIVE_EXACT:
+        return True
+
+    words = normalized.split()
+    if len(words) <= 4 and NEG_PREFIX_RE.match(normalized):
+        return True
+    return len(words) <= 3 and bool(NEG_RE.search(response))
+
+
+HISTORY_FILE = "chat_history/history.jsonl"
+FORM_STATE_FILE = "chat_history/form_state.json"
+
+# Directories we have already created this process, so makedirs is one
+# syscall per directory instead of one per save
+_READY_DIRS = set()
+
+def _ensure_dir(path: str):
+    if path not in _READY_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _READY_DIRS.add(path)
+
+def append_event(filename: str, *events: dict):
+    """Append one or more JSON events to an append-only JSONL log"""
+    _ensure_dir(os.path.dirname(filename))
+    with open(filename, "ab") as f:
+        f.write(b"".join(orjson.dumps(event) + b"\n" for event in events))
+
+def append_turn(user_message: str, assistant_message: str):
+    """Append the latest user/assistant exchange to the transcript log
+
+    The transcript is append-only JSONL, so per-turn I/O is proportional
+    to the new messages instead of the whole conversation.
+    """
+    append_event(
+        HISTORY_FILE,
+        {"role": "user", "content": user_message},
+        {"role": "assistant", "content": assistant_message}
+    )
+
+def save_form_state(interview_form: dict, memory: InterviewMemory):
+    """Snapshot the interview form and memory to a JSON file"""
     data = {
-        "messages": messages,
         "interview_form": interview_form,
-        "memory": {
-            "field_memory": dict(memory.field_memory),
-            "current_responses": dict(memory.current_responses)
-        }
+        "memory": memory.to_dict(),
+        "saved_at": time.time()  # one clock read per snapshot
+    }
+
+    _ensure_dir("chat_history")
+    # Write to a temp file and rename so a crash mid-write can never
+    # leave a torn snapshot behind
+    # No pretty-printing: this file is only machine-read on load
+    tmp = FORM_STATE_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp, FORM_STATE_FILE)
+
+def fresh_interview_form() -> dict:
+    """An empty form shaped after FIELD_REQUIREMENTS"""
+    return {
+        field: {"value": "", "responses": [], "satisfaction": 0}
+        for field in FIELD_REQUIREMENTS
     }
-    
-    os.makedirs("chat_history", exist_ok=True)
-    filename = "chat_history/interview.json"
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
 
 def load_chat_history():
-    """Load chat history and form data from JSON file"""
-    filename = "chat_history/interview.json"
+    """Load the transcript log and form snapshot from disk
+
+    A transcript without a usable form snapshot (crash before the first
+    save, deleted file) still loads: the form falls back to a fresh one
+    so callers never see messages paired with an empty form. Appends
+    are not atomic, so a line torn by a crash mid-write is skipped
+    rather than bricking every subsequent startup.
+    """
+    messages = []
+    try:
+        with open(HISTORY_FILE, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    messages.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    logger.warning("Skipping undecodable transcript line")
+    except FileNotFoundError:
+        pass
+
     try:
-        with open(filename, "r") as f:
-            data = json.load(f)
-            
-            # Create new memory instance and populate it
-            memory = InterviewMemory()
-            memory_data = data.get("memory", {})
-            memory.field_memory = defaultdict(list, memory_data.get("field_memory", {}))
-            memory.current_responses = defaultdict(str, memory_data.get("current_responses", {}))
-            
-            return data.get("messages", []), data.get("interview_form", {}), memory
+        with open(FORM_STATE_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+            memory = InterviewMemory.from_dict(data.get("memory", {}))
+            interview_form = data.get("interview_form") or fresh_interview_form()
+            return messages, interview_form, memory
     except FileNotFoundError:
-        return [], {}, InterviewMemory()
\ No newline at end of file
+        return messages, fresh_interview_form(), InterviewMemory()
\ No newline at end of file